@@ -1,27 +1,15 @@
 import streamlit as st
 import pandas as pd
-import pyodbc
 import time
 import csv
-from io import BytesIO
+from utils.app_core import get_sql_connection, table_version
 from utils.gpt_utils import generate_output_for_group
-from streamlit_searchbox import st_searchbox
+from utils.result_store import save_result, keep_result, export_csv, discard_result
 
 # -------------------- DB Connection --------------------
-def get_sql_connection():
-    return pyodbc.connect(
-        "Driver={ODBC Driver 17 for SQL Server};"
-        "Server=mptcecommerce-sql-server.database.windows.net;"
-        "Database=mptcecommerce-db;"
-        "Uid=mptcadmin;"
-        "Pwd=Mptc@2025;"
-        "Encrypt=yes;"
-        "TrustServerCertificate=no;"
-        "Connection Timeout=60;"
-    )
-
-@st.cache_data
-def load_categories():
+# Cached for a few minutes; writes from Database Access bump the table version so new prompts show up straight away
+@st.cache_data(ttl=300)
+def load_categories(version):
     conn = get_sql_connection()
     df = pd.read_sql("SELECT category_name, gpt_prompt FROM product_categories", conn)
     conn.close()
@@ -34,8 +22,7 @@ st.title("Product Listing Generator for Marketplaces")
 
 # -------------------- Smart Category Selection --------------------
 # Load categories
-load_categories.clear()
-cat_df = load_categories()
+cat_df = load_categories(table_version("product_categories"))
 category_list = cat_df["category_name"].dropna().unique().tolist()
 category_list_sorted = sorted(category_list, key=lambda x: x.lower())
 
@@ -111,7 +98,8 @@ if uploaded_file:
 
     if st.button("Start Title & Description Generation"):
         output_rows = []
-        st.session_state["final_preview_df"] = None
+        discard_result(st.session_state.get("final_preview_path"))
+        st.session_state["final_preview_path"] = None
         st.markdown("### GPT-Generated Preview (Step 1)")
 
         for (brand, name), group in grouped:
@@ -178,15 +166,20 @@ if uploaded_file:
         st.markdown("### Final Preview of GPT Outputs with Product Data")
         st.dataframe(final_preview_df)
         
-        st.session_state["final_preview_df"] = final_preview_df
+        st.session_state["final_preview_path"] = save_result(final_preview_df, prefix="gpt_preview")
 
     # -------------------- Preserve & Download Output --------------------
-    if "final_preview_df" in st.session_state and st.session_state["final_preview_df"] is not None:
-        csv_buffer = BytesIO()
-        st.session_state["final_preview_df"].to_csv(csv_buffer, index=False, quoting=csv.QUOTE_ALL)
-        st.download_button(
-            "⬇️ Download GPT Output",
-            data=csv_buffer.getvalue(),
-            file_name="gpt_preview.csv",
-            mime="text/csv"
-        )
+    final_preview_path = st.session_state.get("final_preview_path")
+    if final_preview_path and not keep_result(final_preview_path):
+        st.session_state["final_preview_path"] = None
+        st.warning("⚠️ The generated output has expired. Please run the generation again to download it.")
+    elif final_preview_path:
+        if st.button("📄 Prepare GPT Output CSV"):
+            csv_path = export_csv(final_preview_path, quoting=csv.QUOTE_ALL)
+            with open(csv_path, "rb") as csv_file:
+                st.download_button(
+                    "⬇️ Download GPT Output",
+                    data=csv_file,
+                    file_name="gpt_preview.csv",
+                    mime="text/csv"
+                )
@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
-import pyodbc
 from io import BytesIO
+from utils.app_core import get_sql_connection, bump_table_version
+from utils.result_store import temporary_csv
 
 # -------------------------------------
 template_cols = {
@@ -18,21 +19,6 @@ template_cols = {
     "dropbox_links": ["group_name", "dropbox_url", "inserted_at"]
 }
 
-# -------------------------------------
-# Setup SQL connection
-def get_sql_connection():
-    conn_str = (
-        "Driver={ODBC Driver 17 for SQL Server};"
-        "Server=mptcecommerce-sql-server.database.windows.net;"
-        "Database=mptcecommerce-db;"
-        "Uid=mptcadmin;"
-        "Pwd=Mptc@2025;"
-        "Encrypt=yes;"
-        "TrustServerCertificate=no;"
-        "Connection Timeout=60;"
-    )
-    return pyodbc.connect(conn_str)
-
 # -------------------------------------
 # Load data from selected table
 def load_table_data(table_name):
@@ -42,7 +28,7 @@ def load_table_data(table_name):
     return df
 
 # -------------------------------------
-# Convert DataFrame to CSV
+# Convert DataFrame to CSV (blank templates only; table exports are written to a temporary file)
 def convert_df_to_csv(df):
     output = BytesIO()
     df.to_csv(output, index=False)
@@ -126,6 +112,9 @@ def overwrite_table(table_name, df):
     conn.commit()
     conn.close()
 
+    # Refresh cached lookups of this table on every page
+    bump_table_version(table_name)
+
 # -------------------------------------
 # Streamlit UI
 st.set_page_config(page_title="📂 SQL Database Manager", layout="wide")
@@ -151,13 +140,17 @@ if table_choice:
     with col1:
         save_clicked = st.button("💾 Save Changes to SQL", use_container_width=True)
     with col2:
-        st.download_button(
-            label="📥 Download Table as CSV",
-            data=convert_df_to_csv(edited_df),
-            file_name=f"{table_choice}_export.csv",
-            mime="text/csv",
-            use_container_width=True
-        )
+        export_clicked = st.button("📄 Prepare Table CSV", use_container_width=True)
+
+    if export_clicked:
+        with temporary_csv(edited_df) as csv_file:
+            st.download_button(
+                label="📥 Download Table as CSV",
+                data=csv_file,
+                file_name=f"{table_choice}_export.csv",
+                mime="text/csv",
+                use_container_width=True
+            )
 
     if save_clicked:
         try:
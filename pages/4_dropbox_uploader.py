@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
-import dropbox
-import pyodbc
+from utils.app_core import upload_to_dropbox, get_sql_connection, table_version, bump_table_version
+from utils.result_store import save_result, keep_result, export_csv, discard_result
 
 # --- Page Setup ---
 st.set_page_config(layout="wide")
@@ -9,19 +9,16 @@ st.markdown("""
     <h3 style='margin-bottom: 10px;'>📤 Upload Product Images to Dropbox</h3>
 """, unsafe_allow_html=True)
 
-# --- Load secrets ---
-DROPBOX_TOKEN = st.secrets["DROPBOX_TOKEN"]
-dbx = dropbox.Dropbox(DROPBOX_TOKEN)
-
 # --- SQL Utilities ---
-def get_product_listing_filters():
-    conn = pyodbc.connect(st.secrets["AZURE_SQL"])
+@st.cache_data(ttl=300)
+def get_product_listing_filters(version):
+    conn = get_sql_connection()
     df = pd.read_sql("SELECT DISTINCT Category, Name, Colour FROM product_listings", conn)
     conn.close()
     return df
 
 def insert_into_db(df):
-    conn = pyodbc.connect(st.secrets["AZURE_SQL"])
+    conn = get_sql_connection()
     cursor = conn.cursor()
     for _, row in df.iterrows():
         cursor.execute("INSERT INTO dropbox_links (group_name, dropbox_url) VALUES (?, ?)",
@@ -29,12 +26,13 @@ def insert_into_db(df):
     conn.commit()
     cursor.close()
     conn.close()
+    bump_table_version("dropbox_links")
 
 def format_folder_segment(text):
     return ''.join(word.capitalize() for word in text.strip().split())
 
 # --- Step 1: Filter Inputs ---
-product_df = get_product_listing_filters()
+product_df = get_product_listing_filters(table_version("product_listings"))
 
 category_options = sorted(product_df['Category'].dropna().unique())
 selected_category = st.selectbox("Select Category", category_options)
@@ -69,16 +67,8 @@ if st.button("🚀 Confirm & Upload to Dropbox"):
             image_bytes = file.read()
             dropbox_path = f"{folder_path}/{file.name}"
 
-            # Upload image
-            dbx.files_upload(image_bytes, dropbox_path, mode=dropbox.files.WriteMode.overwrite)
-
-            # Generate public link
-            try:
-                link = dbx.sharing_create_shared_link_with_settings(dropbox_path)
-                public_url = link.url.replace("?dl=0", "?raw=1")
-            except dropbox.exceptions.ApiError:
-                links = dbx.sharing_list_shared_links(path=dropbox_path).links
-                public_url = links[0].url.replace("?dl=0", "?raw=1") if links else "Error"
+            # Upload image and generate public link
+            public_url = upload_to_dropbox(image_bytes, dropbox_path)
 
             results.append({
                 "Group Name": group_name,
@@ -91,9 +81,20 @@ if st.button("🚀 Confirm & Upload to Dropbox"):
         st.subheader("🔗 Dropbox Image Links")
         st.dataframe(result_df)
 
-        # CSV Download Button
-        csv_data = result_df.to_csv(index=False).encode("utf-8")
-        st.download_button("📥 Download CSV", data=csv_data, file_name=f"{group_name}_links.csv", mime="text/csv")
+        discard_result(st.session_state.get("dropbox_result_path"))
+        st.session_state["dropbox_result_path"] = save_result(result_df, prefix="dropbox_links")
+        st.session_state["dropbox_result_group"] = group_name
+
+# CSV Download Button
+dropbox_result_path = st.session_state.get("dropbox_result_path")
+if dropbox_result_path and not keep_result(dropbox_result_path):
+    st.session_state["dropbox_result_path"] = None
+    st.warning("⚠️ The Dropbox links have expired. Please upload the images again to download them.")
+elif dropbox_result_path:
+    if st.button("📄 Prepare Links CSV"):
+        with open(export_csv(dropbox_result_path), "rb") as csv_file:
+            st.download_button("📥 Download CSV", data=csv_file,
+                               file_name=f"{st.session_state['dropbox_result_group']}_links.csv", mime="text/csv")
 
 # --- Step 4: Manual Upload into Database ---
 st.markdown("---")
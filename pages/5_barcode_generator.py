@@ -1,2 +1,4 @@
+import streamlit as st
+
 st.set_page_config(page_title="📦 Products Barcode Generator", layout="wide")
 st.title(" 𝄃𝄃𝄂𝄂𝄀𝄁𝄃𝄂𝄂𝄃 Barcode Generator")
\ No newline at end of file
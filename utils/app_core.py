@@ -0,0 +1,104 @@
+import os
+import threading
+
+# Clients are created on first use and shared by every session in the process.
+# Heavy client libraries (openai, dropbox, pyodbc) are only imported inside the factories.
+# Each client has its own lock so a slow factory only blocks callers of that client.
+_clients = {}
+_client_locks = {}
+_client_locks_guard = threading.Lock()
+
+# Bumped whenever the app writes to a table; cached loaders take the version as an
+# argument so only lookups of that table are refreshed.
+_table_versions = {}
+_table_versions_lock = threading.Lock()
+
+
+def _client_lock(name):
+    with _client_locks_guard:
+        return _client_locks.setdefault(name, threading.Lock())
+
+
+def _get_or_create(name, factory):
+    client = _clients.get(name)
+    if client is None:
+        with _client_lock(name):
+            client = _clients.get(name)
+            if client is None:
+                client = factory()
+                _clients[name] = client
+    return client
+
+
+# -------------------- OpenAI --------------------
+def _create_openai_client():
+    from dotenv import load_dotenv
+    from openai import OpenAI
+
+    load_dotenv()
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+def get_openai_client():
+    return _get_or_create("openai", _create_openai_client)
+
+
+# -------------------- Dropbox --------------------
+def _create_dropbox_client():
+    import dropbox
+    import streamlit as st
+
+    return dropbox.Dropbox(st.secrets["DROPBOX_TOKEN"])
+
+
+def get_dropbox_client():
+    return _get_or_create("dropbox", _create_dropbox_client)
+
+
+def upload_to_dropbox(data, dropbox_path):
+    """Upload bytes to Dropbox, overwriting any existing file, and return a public raw link."""
+    import dropbox
+
+    dbx = get_dropbox_client()
+    dbx.files_upload(data, dropbox_path, mode=dropbox.files.WriteMode.overwrite)
+
+    try:
+        link = dbx.sharing_create_shared_link_with_settings(dropbox_path)
+        return link.url.replace("?dl=0", "?raw=1")
+    except dropbox.exceptions.ApiError:
+        links = dbx.sharing_list_shared_links(path=dropbox_path).links
+        return links[0].url.replace("?dl=0", "?raw=1") if links else "Error"
+
+
+# -------------------- SQL --------------------
+def _load_pyodbc():
+    import pyodbc
+
+    # Connections are not safe to share between sessions, so the singleton is the
+    # driver module itself; pyodbc's ODBC pooling reuses the physical connections.
+    pyodbc.pooling = True
+    return pyodbc
+
+
+def _sql_connection_string():
+    connection_string = os.getenv("AZURE_SQL")
+    if connection_string:
+        return connection_string
+
+    import streamlit as st
+
+    return st.secrets["AZURE_SQL"]
+
+
+def get_sql_connection():
+    pyodbc = _get_or_create("pyodbc", _load_pyodbc)
+    return pyodbc.connect(_sql_connection_string())
+
+
+def table_version(table_name):
+    return _table_versions.get(table_name, 0)
+
+
+def bump_table_version(table_name):
+    with _table_versions_lock:
+        _table_versions[table_name] = _table_versions.get(table_name, 0) + 1
@@ -1,10 +1,4 @@
-import openai
-import os
-import pandas as pd
-from dotenv import load_dotenv
-
-load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
+from utils.app_core import get_openai_client
 
 def generate_output_for_group(group, image_url, base_prompt):
     try:
@@ -18,7 +12,7 @@ def generate_output_for_group(group, image_url, base_prompt):
 
         full_prompt = f"{base_prompt.strip()}\n\nProduct Info:\n{product_info_text}"
 
-        response = openai.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-4o",
             messages=[
                 {"role": "system", "content": "You are an expert e-commerce product copywriter and SEO strategist."},
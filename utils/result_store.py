@@ -0,0 +1,109 @@
+import os
+import csv
+import glob
+import time
+import uuid
+import tempfile
+from contextlib import contextmanager
+
+# Results live on local disk; only the file path is kept in st.session_state.
+# Note: st.download_button still reads the exported CSV into Streamlit's in-memory
+# media store while it is being served, so a download briefly holds the full file.
+RESULTS_DIR = os.path.join(tempfile.gettempdir(), "mptc_results")
+MAX_AGE_SECONDS = 6 * 60 * 60
+CSV_BATCH_ROWS = 5000
+
+# Columns with few distinct values (Size, Colour, Status, ...) are stored as categoricals
+CATEGORICAL_MAX_RATIO = 0.5
+
+
+def _purge_old_results():
+    cutoff = time.time() - MAX_AGE_SECONDS
+    for name in os.listdir(RESULTS_DIR):
+        path = os.path.join(RESULTS_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            continue
+
+
+def _compact(df):
+    from pandas.api.types import is_object_dtype, is_string_dtype
+
+    df = df.copy()
+    for col in df.columns:
+        if (is_object_dtype(df[col]) or is_string_dtype(df[col])) and len(df) > 0:
+            values = df[col].astype("string")
+            if values.nunique(dropna=True) <= len(df) * CATEGORICAL_MAX_RATIO:
+                df[col] = values.astype("category")
+            else:
+                df[col] = values
+    return df
+
+
+def save_result(df, prefix="result"):
+    """Write a DataFrame to a Parquet file on disk and return its path (the session handle)."""
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    _purge_old_results()
+    path = os.path.join(RESULTS_DIR, f"{prefix}_{uuid.uuid4().hex}.parquet")
+    _compact(df).to_parquet(path, index=False, compression="zstd")
+    return path
+
+
+def keep_result(handle):
+    """Touch a stored result so the purge keeps it; returns False if it has already been removed."""
+    if not handle:
+        return False
+    try:
+        os.utime(handle)
+    except OSError:
+        return False
+    return True
+
+
+def export_csv(handle, quoting=csv.QUOTE_MINIMAL):
+    """Write a stored result to a CSV file next to it, batch by batch, and return the CSV path."""
+    import pyarrow.parquet as pq
+
+    csv_path = f"{os.path.splitext(handle)[0]}.q{quoting}.csv"
+    if os.path.exists(csv_path):
+        os.utime(csv_path)
+        return csv_path
+
+    parquet_file = pq.ParquetFile(handle)
+    tmp_path = csv_path + ".part"
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        header = True
+        for batch in parquet_file.iter_batches(batch_size=CSV_BATCH_ROWS):
+            batch.to_pandas().to_csv(f, index=False, header=header, quoting=quoting)
+            header = False
+        if header:
+            # Empty result: still write the header row
+            parquet_file.schema_arrow.empty_table().to_pandas().to_csv(f, index=False, quoting=quoting)
+    os.replace(tmp_path, csv_path)
+    return csv_path
+
+
+@contextmanager
+def temporary_csv(df, quoting=csv.QUOTE_MINIMAL):
+    """Write a DataFrame straight to a temporary CSV file and yield it open for reading; the file is removed afterwards."""
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(suffix=".csv", dir=RESULTS_DIR)
+    os.close(fd)
+    try:
+        df.to_csv(path, index=False, quoting=quoting)
+        with open(path, "rb") as f:
+            yield f
+    finally:
+        os.remove(path)
+
+
+def discard_result(handle):
+    if not handle:
+        return
+    for path in [handle] + glob.glob(glob.escape(os.path.splitext(handle)[0]) + ".q*.csv"):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
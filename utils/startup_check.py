@@ -0,0 +1,228 @@
+"""Startup-time budget check for the multipage app.
+
+Run from the repository root:
+
+    python -m utils.startup_check --record   # measure and store a baseline
+    python -m utils.startup_check            # compare against the stored baseline
+
+Three things are checked:
+
+* The shared utils modules import none of the heavy libraries (openai, dropbox,
+  pyodbc, pyarrow, pandas). Pages still import pandas at the top on purpose, since
+  they build DataFrames on their first render.
+* home.py cold start: the time for a fresh interpreter to run home.py under
+  streamlit's AppTest, minus the same measurement for an empty script. The number
+  therefore covers only what home.py itself adds, not interpreter spawn, the
+  streamlit import or AppTest setup.
+* Page reruns: the median time of rerunning each page after its first run.
+
+Pages run against a throwaway SQLite database in place of Azure SQL, with stub
+secrets, so no external service is contacted. Each timing must stay within its
+budget: the recorded baseline plus MPTC_STARTUP_MARGIN (default 25%), but never
+less than the baseline plus MPTC_STARTUP_SLACK seconds (default 0.1s), so timings
+that are close to zero do not fail on ordinary jitter. A timing with no recorded
+baseline fails. Exits with status 1 if any check fails.
+"""
+import os
+import sys
+import json
+import glob
+import time
+import sqlite3
+import argparse
+import tempfile
+import statistics
+import subprocess
+from unittest import mock
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT_DIR, "utils", "startup_baseline.json")
+MARGIN = float(os.getenv("MPTC_STARTUP_MARGIN", "0.25"))
+SLACK_S = float(os.getenv("MPTC_STARTUP_SLACK", "0.1"))
+
+LAZY_MODULES = ["utils.app_core", "utils.gpt_utils", "utils.result_store"]
+HEAVY_IMPORTS = ["openai", "dropbox", "pyodbc", "pyarrow", "pandas"]
+
+STUB_SECRETS = {"AZURE_SQL": "stub", "DROPBOX_TOKEN": "stub"}
+
+# Tables the pages read on their first render, with one sample row each
+FIXTURE_TABLES = {
+    "product_categories": {"category_id": 1, "category_name": "Rugs", "gpt_prompt": "Write a title."},
+    "product_listings": {
+        "SKU": "SKU-1", "Name": "Sample Rug", "Size": "120x170", "Colour": "Grey", "Category": "Rugs",
+        "Finish/ Style": "", "Feature": "", "Care Instructions": "", "Composition": "",
+        "Product Width": "", "Product Length": "", "Product Height": "",
+        "Title 1": "", "Title 2": "", "Title 3": "", "Title 4": "",
+        "Description": "", "Status": "Generated", "Includes": "",
+    },
+    "products_word_bank": dict(
+        {"category_id": 1, "category_name": "Rugs", "sub_category": "Runner"},
+        **{f"keyword_{i}": "" for i in range(1, 126)}
+    ),
+    "dropbox_links": {"group_name": "Rugs-SampleRug-Grey", "dropbox_url": "", "inserted_at": "2025-01-01"},
+}
+
+_IMPORT_PROBE = """
+import sys
+for name in {modules!r}:
+    __import__(name)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+_COLD_START_PROBE = """
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({path!r}, default_timeout={timeout!r})
+at.run()
+for exc in at.exception:
+    print(exc.message)
+"""
+
+
+def _run_python(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True
+    )
+
+
+def _build_fixture_db(path):
+    conn = sqlite3.connect(path)
+    for table, row in FIXTURE_TABLES.items():
+        columns = ", ".join(f'"{col}"' for col in row)
+        placeholders = ", ".join("?" for _ in row)
+        conn.execute(f"CREATE TABLE {table} ({columns})")
+        conn.execute(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", list(row.values()))
+    conn.commit()
+    conn.close()
+
+
+def check_lazy_imports():
+    result = _run_python(_IMPORT_PROBE.format(modules=LAZY_MODULES, heavy=HEAVY_IMPORTS))
+    if result.returncode != 0:
+        return False, None, f"import failed:\n{result.stderr.strip()}"
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    if loaded:
+        return False, None, f"imported eagerly: {', '.join(loaded)}"
+    return True, None, "no heavy libraries imported"
+
+
+def _time_cold_run(path, timeout):
+    start = time.perf_counter()
+    result = _run_python(_COLD_START_PROBE.format(path=path, timeout=timeout))
+    elapsed = time.perf_counter() - start
+    errors = (result.stdout if result.returncode == 0 else result.stderr).strip()
+    return elapsed, errors
+
+
+def check_cold_start(runs, timeout):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        empty_script = os.path.join(tmp_dir, "empty.py")
+        with open(empty_script, "w") as f:
+            f.write("import streamlit as st\n")
+
+        overhead, home = [], []
+        for _ in range(runs):
+            elapsed, errors = _time_cold_run(empty_script, timeout)
+            if errors:
+                return False, None, f"AppTest setup failed:\n{errors}"
+            overhead.append(elapsed)
+
+            elapsed, errors = _time_cold_run(os.path.join(ROOT_DIR, "home.py"), timeout)
+            if errors:
+                return False, None, f"home.py raised:\n{errors}"
+            home.append(elapsed)
+
+    elapsed = max(statistics.median(home) - statistics.median(overhead), 0.0)
+    return True, elapsed, f"{elapsed:.2f}s over {statistics.median(overhead):.2f}s AppTest overhead"
+
+
+def check_page_rerun(path, reruns, timeout, fixture_db):
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError as e:
+        return False, None, f"streamlit is not importable: {e}"
+
+    def fake_sql_connection():
+        return sqlite3.connect(fixture_db, check_same_thread=False)
+
+    at = AppTest.from_file(path, default_timeout=timeout)
+    for key, value in STUB_SECRETS.items():
+        at.secrets[key] = value
+
+    with mock.patch("utils.app_core.get_sql_connection", fake_sql_connection):
+        at.run()
+        if at.exception:
+            return False, None, f"raised on first run: {at.exception[0].message}"
+
+        timings = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            at.run()
+            timings.append(time.perf_counter() - start)
+        if at.exception:
+            return False, None, f"raised on rerun: {at.exception[0].message}"
+
+    elapsed = statistics.median(timings)
+    return True, elapsed, f"{elapsed:.2f}s median of {reruns}"
+
+
+def _load_baseline():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check app startup and rerun times against a recorded baseline.")
+    parser.add_argument("--record", action="store_true", help="Store the measured timings as the new baseline")
+    parser.add_argument("--runs", type=int, default=10, help="Cold starts / reruns to time for each check")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-run timeout in seconds")
+    parser.add_argument("pages", nargs="*", help="Page scripts to time (default: every file in pages/)")
+    args = parser.parse_args(argv)
+
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import utils.app_core  # noqa: F401  (so mock.patch can find it)
+
+    pages = args.pages or sorted(glob.glob(os.path.join(ROOT_DIR, "pages", "*.py")))
+    checks = [("lazy imports", check_lazy_imports())]
+    checks.append(("home.py cold start", check_cold_start(args.runs, args.timeout)))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fixture_db = os.path.join(tmp_dir, "fixture.db")
+        _build_fixture_db(fixture_db)
+        for page in pages:
+            checks.append((f"{os.path.basename(page)} rerun",
+                           check_page_rerun(os.path.abspath(page), args.runs, args.timeout, fixture_db)))
+
+    baseline = _load_baseline()
+    measured = {}
+    failed = False
+    for name, (ok, elapsed, detail) in checks:
+        status = "PASS" if ok else "FAIL"
+        if ok and elapsed is not None:
+            measured[name] = round(elapsed, 3)
+            if not args.record:
+                if name not in baseline:
+                    ok = False
+                    status, detail = "FAIL", f"{detail}; no baseline recorded (run with --record)"
+                else:
+                    budget = max(baseline[name] * (1 + MARGIN), baseline[name] + SLACK_S)
+                    ok = elapsed <= budget
+                    status = "PASS" if ok else "FAIL"
+                    detail = f"{detail} (budget {budget:.2f}s from baseline {baseline[name]:.2f}s)"
+        print(f"{status}  {name}: {detail}")
+        failed = failed or not ok
+
+    if args.record:
+        if failed:
+            print("Not recording a baseline while checks fail.")
+        else:
+            with open(BASELINE_PATH, "w") as f:
+                json.dump(measured, f, indent=2, sort_keys=True)
+                f.write("\n")
+            print(f"Baseline written to {os.path.relpath(BASELINE_PATH, ROOT_DIR)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())